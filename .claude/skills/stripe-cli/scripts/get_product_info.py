@@ -1,19 +1,45 @@
 #!/usr/bin/env python3
 """
-Retrieve detailed information about a Stripe product or price.
+Retrieve detailed information about Stripe products or prices.
 
 Usage:
-    python3 get_product_info.py <product_id_or_price_id>
+    python3 get_product_info.py <product_id_or_price_id> [<id> ...]
 
 Example:
     python3 get_product_info.py prod_ABC123
     python3 get_product_info.py price_XYZ789
+    python3 get_product_info.py prod_ABC123 prod_DEF456 price_XYZ789
+    python3 get_product_info.py prod_ABC123 --no-cache
+
+If the stripe Python SDK is installed and STRIPE_API_KEY holds a test mode key,
+lookups go straight to the API over a shared HTTP connection instead of
+spawning the stripe CLI.
+
+Results are cached in ~/.cache/stripe-cli/cache.json for an hour by default;
+use --ttl to change the lifetime or --no-cache to always fetch fresh data.
 """
 
 import argparse
+import os
 import subprocess
 import sys
 import json
+import time
+from pathlib import Path
+
+try:
+    import stripe
+except ImportError:
+    stripe = None
+
+
+# Stripe caps list endpoints at 100 objects per page
+LIST_PAGE_LIMIT = 100
+
+CACHE_FILE = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "stripe-cli" / "cache.json"
+DEFAULT_CACHE_TTL = 3600
 
 
 def run_stripe_command(args):
@@ -31,103 +57,228 @@ def run_stripe_command(args):
         sys.exit(1)
 
 
-def get_resource_info(resource_id):
-    """Get information about a product or price."""
-    # Determine resource type from ID prefix
-    if resource_id.startswith("prod_"):
-        resource_type = "products"
-    elif resource_id.startswith("price_"):
-        resource_type = "prices"
-    else:
-        print(f"Error: Unknown resource type for ID '{resource_id}'", file=sys.stderr)
-        print("Expected 'prod_*' or 'price_*'", file=sys.stderr)
+def parse_json_output(output, resource_type):
+    """Parse stripe CLI JSON output, exiting on malformed output."""
+    try:
+        return json.loads(output)
+    except json.JSONDecodeError as e:
+        print(f"Failed to parse {resource_type} output: {e}", file=sys.stderr)
+        print(f"Output was: {output}", file=sys.stderr)
         sys.exit(1)
 
+
+def get_resource_type(resource_id):
+    """Determine resource type from ID prefix."""
+    if resource_id.startswith("prod_"):
+        return "products"
+    if resource_id.startswith("price_"):
+        return "prices"
+
+    print(f"Error: Unknown resource type for ID '{resource_id}'", file=sys.stderr)
+    print("Expected 'prod_*' or 'price_*'", file=sys.stderr)
+    sys.exit(1)
+
+
+def get_resource_info(resource_id):
+    """Get information about a single product or price."""
+    resource_type = get_resource_type(resource_id)
     args = [resource_type, "retrieve", resource_id]
     output = run_stripe_command(args)
-    return output, resource_type
-
-
-def parse_product_output(output):
-    """Parse product output into key details."""
-    details = {}
-    for line in output.split('\n'):
-        line = line.strip()
-        if line.startswith('id '):
-            details['id'] = line.split(maxsplit=1)[1]
-        elif line.startswith('name '):
-            details['name'] = line.split(maxsplit=1)[1]
-        elif line.startswith('description '):
-            details['description'] = line.split(maxsplit=1)[1]
-        elif line.startswith('active '):
-            details['active'] = line.split(maxsplit=1)[1]
-    return details
-
-
-def parse_price_output(output):
-    """Parse price output into key details."""
-    details = {}
-    in_recurring = False
-
-    for line in output.split('\n'):
-        line_stripped = line.strip()
-
-        if line_stripped.startswith('id '):
-            details['id'] = line_stripped.split(maxsplit=1)[1]
-        elif line_stripped.startswith('product '):
-            details['product'] = line_stripped.split(maxsplit=1)[1]
-        elif line_stripped.startswith('unit_amount '):
-            amount_cents = line_stripped.split(maxsplit=1)[1]
-            details['unit_amount_cents'] = amount_cents
-            details['unit_amount_dollars'] = f"${int(amount_cents) / 100:.2f}"
-        elif line_stripped.startswith('currency '):
-            details['currency'] = line_stripped.split(maxsplit=1)[1]
-        elif line_stripped.startswith('active '):
-            details['active'] = line_stripped.split(maxsplit=1)[1]
-        elif line_stripped.startswith('recurring '):
-            in_recurring = True
-        elif in_recurring and line_stripped.startswith('interval '):
-            details['interval'] = line_stripped.split(maxsplit=1)[1]
-            in_recurring = False
-
-    return details
+    return parse_json_output(output, resource_type), resource_type
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Get detailed information about a Stripe product or price"
-    )
-    parser.add_argument("id", help="Product ID (prod_*) or Price ID (price_*)")
+def get_products(product_ids):
+    """Fetch several products with one list call per page of IDs."""
+    products = {}
+    for start in range(0, len(product_ids), LIST_PAGE_LIMIT):
+        page = product_ids[start:start + LIST_PAGE_LIMIT]
+        args = ["products", "list", "-d", f"limit={len(page)}"]
+        for product_id in page:
+            args.extend(["-d", f"ids[]={product_id}"])
+        output = run_stripe_command(args)
+        for product in parse_json_output(output, "products").get("data", []):
+            products[product["id"]] = product
+    return products
 
-    args = parser.parse_args()
 
-    print(f"Retrieving information for: {args.id}\n")
-    output, resource_type = get_resource_info(args.id)
+def get_sdk_client():
+    """Configure the stripe SDK if it is installed and a test mode key is set."""
+    api_key = os.environ.get("STRIPE_API_KEY", "")
+    if stripe is None or not api_key.startswith(("sk_test_", "rk_test_")):
+        return None
+
+    stripe.api_key = api_key
+    # RequestsClient keeps one pooled session alive across lookups;
+    # without the requests package the SDK falls back to its default client
+    try:
+        stripe.default_http_client = stripe.RequestsClient()
+    except (ImportError, AssertionError):
+        pass
+    return stripe
+
+
+def get_resources_sdk(client, product_ids, price_ids):
+    """Fetch products and prices through the stripe SDK, keyed by ID."""
+    resources = {}
+    try:
+        for start in range(0, len(product_ids), LIST_PAGE_LIMIT):
+            page = product_ids[start:start + LIST_PAGE_LIMIT]
+            for product in client.Product.list(ids=page, limit=len(page)).data:
+                resources[product.id] = product.to_dict()
+        for price_id in price_ids:
+            resources[price_id] = client.Price.retrieve(price_id).to_dict()
+    except client.error.StripeError as e:
+        print(f"Error: {e.user_message or e}", file=sys.stderr)
+        sys.exit(1)
+    return resources
+
+
+def load_cache():
+    """Load cached lookups, treating a missing or corrupt file or entry as empty."""
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in cache.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("fetched_at"), (int, float))
+        and "data" in entry
+    }
+
 
+def save_cache(cache):
+    """Persist cached lookups; failures only cost a future cache miss."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not write cache: {e}", file=sys.stderr)
+
+
+def fetch_resources(product_ids, price_ids):
+    """Fetch products and prices from Stripe, keyed by ID."""
+    client = get_sdk_client()
+    if client is not None:
+        return get_resources_sdk(client, product_ids, price_ids)
+
+    # Listing skips unknown product IDs instead of aborting the run like retrieve does
+    resources = get_products(product_ids)
+
+    # The prices list endpoint has no ID filter, so prices are retrieved individually
+    for price_id in price_ids:
+        data, _ = get_resource_info(price_id)
+        resources[data["id"]] = data
+
+    return resources
+
+
+def get_resources(resource_ids, use_cache=True, ttl=DEFAULT_CACHE_TTL):
+    """Fetch all requested resources, keyed by ID, serving fresh entries from cache."""
+    cache = load_cache() if use_cache else {}
+    now = time.time()
+
+    resources = {}
+    product_ids = []
+    price_ids = []
+    # dict.fromkeys drops duplicate IDs so each is looked up once per run
+    for resource_id in dict.fromkeys(resource_ids):
+        resource_type = get_resource_type(resource_id)
+        entry = cache.get(f"{resource_type}:{resource_id}")
+        if entry and now - entry["fetched_at"] < ttl:
+            resources[resource_id] = entry["data"]
+        elif resource_type == "products":
+            product_ids.append(resource_id)
+        else:
+            price_ids.append(resource_id)
+
+    if not product_ids and not price_ids:
+        return resources
+
+    fetched = fetch_resources(product_ids, price_ids)
+    resources.update(fetched)
+
+    if use_cache:
+        # Drop expired entries so the file doesn't grow with every lookup ever made
+        cache = {key: entry for key, entry in cache.items() if now - entry["fetched_at"] < ttl}
+        for resource_id, data in fetched.items():
+            cache[f"{get_resource_type(resource_id)}:{resource_id}"] = {
+                "fetched_at": now,
+                "data": data,
+            }
+        save_cache(cache)
+
+    return resources
+
+
+def print_resource(data, resource_type):
+    """Print a human-readable summary of a product or price."""
     print("="*60)
     if resource_type == "products":
-        details = parse_product_output(output)
         print("PRODUCT INFORMATION")
         print("="*60)
-        print(f"ID:          {details.get('id', 'N/A')}")
-        print(f"Name:        {details.get('name', 'N/A')}")
-        print(f"Description: {details.get('description', 'N/A')}")
-        print(f"Active:      {details.get('active', 'N/A')}")
+        print(f"ID:          {data.get('id', 'N/A')}")
+        print(f"Name:        {data.get('name', 'N/A')}")
+        print(f"Description: {data.get('description') or 'N/A'}")
+        print(f"Active:      {str(data.get('active', 'N/A')).lower()}")
 
     elif resource_type == "prices":
-        details = parse_price_output(output)
+        unit_amount = data.get('unit_amount')
+        amount = f"${unit_amount / 100:.2f}" if unit_amount is not None else 'N/A'
+        interval = (data.get('recurring') or {}).get('interval')
+
         print("PRICE INFORMATION")
         print("="*60)
-        print(f"ID:       {details.get('id', 'N/A')}")
-        print(f"Product:  {details.get('product', 'N/A')}")
-        print(f"Amount:   {details.get('unit_amount_dollars', 'N/A')} {details.get('currency', '').upper()}")
-        if 'interval' in details:
-            print(f"Interval: {details.get('interval', 'N/A')}")
-        print(f"Active:   {details.get('active', 'N/A')}")
+        print(f"ID:       {data.get('id', 'N/A')}")
+        print(f"Product:  {data.get('product', 'N/A')}")
+        print(f"Amount:   {amount} {(data.get('currency') or '').upper()}")
+        if interval:
+            print(f"Interval: {interval}")
+        print(f"Active:   {str(data.get('active', 'N/A')).lower()}")
 
     print("\nFull output:")
     print("-"*60)
-    print(output)
+    print(json.dumps(data, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Get detailed information about Stripe products or prices"
+    )
+    parser.add_argument("id", nargs="+", help="Product IDs (prod_*) or Price IDs (price_*)")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch fresh data from Stripe")
+    parser.add_argument(
+        "--ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Cache lifetime in seconds (default: {DEFAULT_CACHE_TTL})"
+    )
+
+    args = parser.parse_args()
+
+    print(f"Retrieving information for: {', '.join(args.id)}\n")
+    resources = get_resources(args.id, use_cache=not args.no_cache, ttl=args.ttl)
+
+    missing = False
+    for index, resource_id in enumerate(args.id):
+        if index:
+            print()
+        data = resources.get(resource_id)
+        if data is None:
+            print(f"Error: No resource found for ID '{resource_id}'", file=sys.stderr)
+            missing = True
+            continue
+        print_resource(data, get_resource_type(resource_id))
+
+    if missing:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
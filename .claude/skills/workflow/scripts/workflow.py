@@ -18,21 +18,92 @@ Usage:
 
 import argparse
 import json
+import os
+import re
+import shutil
 import subprocess
 import sys
-import uuid
+from collections import Counter
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Reject stdin workflow payloads larger than this before parsing them
+MAX_WORKFLOW_BYTES = 1024 * 1024
+
+# orjson only keeps integers within 64 bits exactly and turns larger ones into
+# floats; any run of 19+ digits may fall outside that range
+_WIDE_NUMBER_RE = re.compile(rb"\d{19,}")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed and cannot lose precision."""
+    if orjson is not None and not _WIDE_NUMBER_RE.search(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    """Encode to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Integers beyond 64 bits, which only the stdlib encoder supports
+            pass
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def read_workflow_stdin() -> Any:
+    """Read and decode workflow JSON from stdin, exiting if it is too large."""
+    data = sys.stdin.buffer.read(MAX_WORKFLOW_BYTES + 1)
+    if len(data) > MAX_WORKFLOW_BYTES:
+        print(f"Error: Workflow JSON from stdin exceeds {MAX_WORKFLOW_BYTES // 1024} KB limit", file=sys.stderr)
+        sys.exit(1)
+    return _loads(data)
+
 
 def generate_action_id() -> str:
-    """Generate a unique action ID."""
-    return str(uuid.uuid4())[:8]
+    """Generate a unique action ID (8 random hex characters)."""
+    # Imported lazily so commands that never build templates skip it
+    import secrets
+    return secrets.token_hex(4)
 
 
 # =============================================================================
 # WORKFLOW TEMPLATES
 # =============================================================================
 
+# Constant template fragments, built once at import rather than on every call
+_WEBHOOK_BODY = _dumps({
+    "text": "{{ !ref($.trigger.outputs.text) }}",
+    "authorUrl": "{{ !ref($.trigger.outputs.authorUrl) }}",
+    "postUrl": "{{ !ref($.trigger.outputs.postUrl) }}",
+    "source": "{{ !ref($.trigger.outputs.source) }}"
+})
+
+_POSITIVE_MESSAGE = "Positive post found!\n\n{{ !ref($.trigger.outputs.text) }}\n\nLink: {{ !ref($.trigger.outputs.postUrl) }}"
+_NEGATIVE_MESSAGE = "Negative post needs review:\n\n{{ !ref($.trigger.outputs.text) }}\n\nLink: {{ !ref($.trigger.outputs.postUrl) }}"
+
+# Map CRM name to action kind
+_CRM_ACTIONS = {
+    "hubspot": "hubspot_create_contact",
+    "salesforce": "salesforce_create_contact",
+    "attio": "attio_create_contact"
+}
+
+_COMPETITOR_SUMMARY_MESSAGE = (
+    "Competitor engagement analysis complete.\n\n"
+    "Post: {{{{ !ref($.trigger.outputs.postUrl) }}}}\n"
+    "Total likers analyzed: {{{{ !ref($.{loop_id}.output.totalItems) }}}}"
+)
+
+
 def template_slack_notification(channel: str, message: str) -> dict:
     """
     Simple Slack notification workflow.
@@ -83,12 +154,7 @@ def template_webhook_forward(url: str, method: str = "POST") -> dict:
                 "inputs": {
                     "method": method,
                     "url": url,
-                    "body": json.dumps({
-                        "text": "{{ !ref($.trigger.outputs.text) }}",
-                        "authorUrl": "{{ !ref($.trigger.outputs.authorUrl) }}",
-                        "postUrl": "{{ !ref($.trigger.outputs.postUrl) }}",
-                        "source": "{{ !ref($.trigger.outputs.source) }}"
-                    })
+                    "body": _WEBHOOK_BODY
                 }
             }
         ],
@@ -145,7 +211,7 @@ def template_sentiment_filter(positive_channel: str, negative_channel: str) -> d
                 "name": "Send to Positive Channel",
                 "inputs": {
                     "channel": positive_channel,
-                    "message": "Positive post found!\n\n{{ !ref($.trigger.outputs.text) }}\n\nLink: {{ !ref($.trigger.outputs.postUrl) }}"
+                    "message": _POSITIVE_MESSAGE
                 }
             },
             {
@@ -154,7 +220,7 @@ def template_sentiment_filter(positive_channel: str, negative_channel: str) -> d
                 "name": "Send to Negative Channel",
                 "inputs": {
                     "channel": negative_channel,
-                    "message": "Negative post needs review:\n\n{{ !ref($.trigger.outputs.text) }}\n\nLink: {{ !ref($.trigger.outputs.postUrl) }}"
+                    "message": _NEGATIVE_MESSAGE
                 }
             }
         ],
@@ -189,14 +255,7 @@ def template_lead_enrich(crm: str) -> dict:
     enrich_id = f"enrich_{generate_action_id()}"
     crm_id = f"crm_{generate_action_id()}"
 
-    # Map CRM name to action kind
-    crm_actions = {
-        "hubspot": "hubspot_create_contact",
-        "salesforce": "salesforce_create_contact",
-        "attio": "attio_create_contact"
-    }
-
-    crm_kind = crm_actions.get(crm.lower())
+    crm_kind = _CRM_ACTIONS.get(crm.lower())
     if not crm_kind:
         raise ValueError(f"Unsupported CRM: {crm}. Supported: hubspot, salesforce, attio")
 
@@ -286,7 +345,7 @@ def template_competitor_engagement(slack_channel: str) -> dict:
                 "name": "Send Summary",
                 "inputs": {
                     "channel": slack_channel,
-                    "message": f"Competitor engagement analysis complete.\n\nPost: {{{{ !ref($.trigger.outputs.postUrl) }}}}\nTotal likers analyzed: {{{{ !ref($.{loop_id}.output.totalItems) }}}}"
+                    "message": _COMPETITOR_SUMMARY_MESSAGE.format(loop_id=loop_id)
                 }
             }
         ],
@@ -313,46 +372,85 @@ def template_competitor_engagement(slack_channel: str) -> dict:
     }
 
 
-TEMPLATES = {
+# Read-only: the table is shared by parsing, dispatch and listing
+TEMPLATES = MappingProxyType({
     "slack-notification": {
         "description": "Simple notification to Slack channel",
-        "args": ["--channel", "--message"],
-        "func": template_slack_notification
+        "func": template_slack_notification,
+        "options": {
+            "--channel": {"required": True, "help": "Slack channel"},
+            "--message": {"required": True, "help": "Message template"}
+        }
     },
     "webhook-forward": {
         "description": "Forward posts to external webhook",
-        "args": ["--url", "--method (optional, default POST)"],
-        "func": template_webhook_forward
+        "func": template_webhook_forward,
+        "options": {
+            "--url": {"required": True, "help": "Webhook URL"},
+            "--method": {"required": False, "default": "POST", "help": "HTTP method"}
+        }
     },
     "sentiment-filter": {
         "description": "Route posts by sentiment to different channels",
-        "args": ["--positive-channel", "--negative-channel"],
-        "func": template_sentiment_filter
+        "func": template_sentiment_filter,
+        "options": {
+            "--positive-channel": {"required": True, "help": "Positive sentiment channel"},
+            "--negative-channel": {"required": True, "help": "Negative sentiment channel"}
+        }
     },
     "lead-enrich": {
         "description": "Enrich post authors and add to CRM",
-        "args": ["--crm (hubspot|salesforce|attio)"],
-        "func": template_lead_enrich
+        "func": template_lead_enrich,
+        "options": {
+            "--crm": {"required": True, "choices": list(_CRM_ACTIONS), "help": "CRM type"}
+        }
     },
     "competitor-engagement": {
         "description": "Analyze engagement on competitor posts",
-        "args": ["--slack-channel"],
-        "func": template_competitor_engagement
+        "func": template_competitor_engagement,
+        "options": {
+            "--slack-channel": {"required": True, "help": "Slack channel"}
+        }
     }
-}
+})
+
+
+def template_option_dest(flag: str) -> str:
+    """Map a template flag to its argparse dest, which is also the template function parameter."""
+    return flag[2:].replace("-", "_")
+
+
+def describe_template_option(flag: str, spec: dict) -> str:
+    """Format a template flag for the templates listing."""
+    details = []
+    if spec.get("choices"):
+        details.append("|".join(spec["choices"]))
+    if not spec["required"]:
+        details.append(f"optional, default {spec['default']}" if "default" in spec else "optional")
+    return f"{flag} ({'; '.join(details)})" if details else flag
 
 
 # =============================================================================
 # VALIDATION
 # =============================================================================
 
-def validate_workflow(workflow: dict) -> tuple[bool, list[str]]:
+# Action kinds that must have exactly two outgoing edges, with their display label
+BRANCHING_KINDS = {
+    "builtin:if": "IF",
+    "builtin:loop": "Loop"
+}
+
+
+def validate_workflow(workflow: Any) -> tuple[bool, list[str]]:
     """
     Validate workflow structure.
     Returns (is_valid, list of errors)
     """
     errors = []
 
+    if not isinstance(workflow, dict):
+        return False, ["Workflow must be a JSON object"]
+
     # Check required fields
     if "trigger" not in workflow:
         errors.append("Missing 'trigger' field")
@@ -364,32 +462,45 @@ def validate_workflow(workflow: dict) -> tuple[bool, list[str]]:
     if errors:
         return False, errors
 
-    # Check action IDs are unique
-    action_ids = [a.get("id") for a in workflow.get("actions", [])]
-    if len(action_ids) != len(set(action_ids)):
-        errors.append("Action IDs must be unique")
-
-    # Check IF nodes have exactly 2 outgoing edges
-    if_actions = [a["id"] for a in workflow.get("actions", []) if a.get("kind") == "builtin:if"]
-    for if_id in if_actions:
-        outgoing = [e for e in workflow.get("edges", []) if e.get("from") == if_id]
-        if len(outgoing) != 2:
-            errors.append(f"IF action '{if_id}' must have exactly 2 outgoing edges (has {len(outgoing)})")
-
-    # Check Loop nodes have exactly 2 outgoing edges
-    loop_actions = [a["id"] for a in workflow.get("actions", []) if a.get("kind") == "builtin:loop"]
-    for loop_id in loop_actions:
-        outgoing = [e for e in workflow.get("edges", []) if e.get("from") == loop_id]
-        if len(outgoing) != 2:
-            errors.append(f"Loop action '{loop_id}' must have exactly 2 outgoing edges (has {len(outgoing)})")
-
-    # Check edge references exist
-    valid_sources = ["$trigger"] + action_ids
-    for edge in workflow.get("edges", []):
-        if edge.get("from") not in valid_sources:
-            errors.append(f"Edge 'from' references unknown source: {edge.get('from')}")
-        if edge.get("to") not in action_ids:
-            errors.append(f"Edge 'to' references unknown action: {edge.get('to')}")
+    actions = workflow["actions"]
+    edges = workflow["edges"]
+
+    if not isinstance(actions, list):
+        errors.append("'actions' must be a list")
+    if not isinstance(edges, list):
+        errors.append("'edges' must be a list")
+
+    if errors:
+        return False, errors
+
+    try:
+        # Check action IDs are unique
+        id_counts = Counter(a.get("id") for a in actions)
+        duplicates = [str(action_id) for action_id, count in id_counts.items() if count > 1]
+        if duplicates:
+            errors.append(f"Action IDs must be unique (duplicates: {', '.join(duplicates)})")
+
+        # Check IF and Loop nodes have exactly 2 outgoing edges
+        outgoing_counts = Counter(e.get("from") for e in edges)
+        for action in actions:
+            label = BRANCHING_KINDS.get(action.get("kind"))
+            if label:
+                outgoing = outgoing_counts[action.get("id")]
+                if outgoing != 2:
+                    errors.append(f"{label} action '{action.get('id')}' must have exactly 2 outgoing edges (has {outgoing})")
+
+        # Check edge references exist
+        action_ids = id_counts.keys()
+        valid_sources = {"$trigger", *action_ids}
+        for edge in edges:
+            if edge.get("from") not in valid_sources:
+                errors.append(f"Edge 'from' references unknown source: {edge.get('from')}")
+            if edge.get("to") not in action_ids:
+                errors.append(f"Edge 'to' references unknown action: {edge.get('to')}")
+    except (AttributeError, TypeError) as e:
+        # Actions/edges that are not objects, or IDs that are not hashable
+        errors.append(f"Malformed actions or edges: {e}")
+        return False, errors
 
     return len(errors) == 0, errors
 
@@ -398,14 +509,52 @@ def validate_workflow(workflow: dict) -> tuple[bool, list[str]]:
 # CLI WRAPPER
 # =============================================================================
 
-def run_trigify_cli(args: list[str]) -> tuple[bool, str]:
-    """Run trigify-cli command and return (success, output)."""
+# Defaults to a trigify-app checkout alongside this repository
+TRIGIFY_APP_DIR = os.environ.get("TRIGIFY_APP_DIR") or str(
+    Path(__file__).resolve().parents[5] / "trigify-app"
+)
+
+
+def resolve_trigify_cli() -> list[str]:
+    """
+    Resolve the trigify-cli command once.
+    Prefers a direct binary over npx, which re-resolves the package on every spawn,
+    but keeps npx's precedence of the app's pinned local binary over PATH.
+    """
+    explicit = os.environ.get("TRIGIFY_BIN")
+    if explicit:
+        return [explicit]
+
+    local_binary = os.path.join(TRIGIFY_APP_DIR, "node_modules", ".bin", "trigify-cli")
+    if os.access(local_binary, os.X_OK):
+        return [local_binary]
+
+    binary = shutil.which("trigify-cli")
+    if binary:
+        return [binary]
+
+    return ["npx", "trigify-cli"]
+
+
+TRIGIFY_CLI = resolve_trigify_cli()
+
+
+def run_trigify_cli(args: list[str], input_data: Optional[str] = None) -> tuple[bool, str]:
+    """Run trigify-cli command, optionally piping input_data to stdin, and return (success, output)."""
+    # A missing cwd also raises FileNotFoundError, which would be misreported as a missing CLI
+    if not os.path.isdir(TRIGIFY_APP_DIR):
+        return False, (
+            f"trigify-app directory not found: {TRIGIFY_APP_DIR}. "
+            "Set TRIGIFY_APP_DIR to the path of your trigify-app checkout."
+        )
+
     try:
         result = subprocess.run(
-            ["npx", "trigify-cli"] + args,
+            TRIGIFY_CLI + args,
+            input=input_data,
             capture_output=True,
             text=True,
-            cwd="/Users/morganparry/repos/trigify-app"
+            cwd=TRIGIFY_APP_DIR
         )
         if result.returncode != 0:
             return False, result.stderr or result.stdout
@@ -423,7 +572,8 @@ def cmd_templates(args):
     for name, info in TEMPLATES.items():
         print(f"\n{name}")
         print(f"  Description: {info['description']}")
-        print(f"  Arguments: {', '.join(info['args'])}")
+        arguments = [describe_template_option(flag, spec) for flag, spec in info["options"].items()]
+        print(f"  Arguments: {', '.join(arguments)}")
     print("\n" + "=" * 60)
     print("\nUsage: workflow.py create --name 'Name' --search-id <id> --template <name> [args]")
 
@@ -433,7 +583,7 @@ def cmd_create(args):
     if args.workflow_stdin:
         # Read workflow from stdin
         try:
-            workflow_json = json.load(sys.stdin)
+            workflow_json = read_workflow_stdin()
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON from stdin: {e}", file=sys.stderr)
             sys.exit(1)
@@ -445,37 +595,24 @@ def cmd_create(args):
             print(f"Available templates: {', '.join(TEMPLATES.keys())}", file=sys.stderr)
             sys.exit(1)
 
-        try:
-            if args.template == "slack-notification":
-                if not args.channel or not args.message:
-                    print("Error: --channel and --message required for slack-notification template", file=sys.stderr)
-                    sys.exit(1)
-                workflow_json = template_slack_notification(args.channel, args.message)
-
-            elif args.template == "webhook-forward":
-                if not args.url:
-                    print("Error: --url required for webhook-forward template", file=sys.stderr)
-                    sys.exit(1)
-                workflow_json = template_webhook_forward(args.url, args.method or "POST")
-
-            elif args.template == "sentiment-filter":
-                if not args.positive_channel or not args.negative_channel:
-                    print("Error: --positive-channel and --negative-channel required for sentiment-filter template", file=sys.stderr)
-                    sys.exit(1)
-                workflow_json = template_sentiment_filter(args.positive_channel, args.negative_channel)
-
-            elif args.template == "lead-enrich":
-                if not args.crm:
-                    print("Error: --crm required for lead-enrich template", file=sys.stderr)
-                    sys.exit(1)
-                workflow_json = template_lead_enrich(args.crm)
-
-            elif args.template == "competitor-engagement":
-                if not args.slack_channel:
-                    print("Error: --slack-channel required for competitor-engagement template", file=sys.stderr)
-                    sys.exit(1)
-                workflow_json = template_competitor_engagement(args.slack_channel)
+        missing = [
+            flag
+            for flag, spec in template_info["options"].items()
+            if spec["required"] and not getattr(args, template_option_dest(flag), None)
+        ]
+        if missing:
+            print(f"Error: {' and '.join(missing)} required for {args.template} template", file=sys.stderr)
+            sys.exit(1)
+
+        # Unset optional arguments fall back to the template function's defaults
+        kwargs = {}
+        for flag in template_info["options"]:
+            value = getattr(args, template_option_dest(flag), None)
+            if value:
+                kwargs[template_option_dest(flag)] = value
 
+        try:
+            workflow_json = template_info["func"](**kwargs)
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -483,13 +620,14 @@ def cmd_create(args):
         print("Error: Either --template or --workflow-stdin required", file=sys.stderr)
         sys.exit(1)
 
-    # Validate workflow
-    is_valid, errors = validate_workflow(workflow_json)
-    if not is_valid:
-        print("Workflow validation errors:", file=sys.stderr)
-        for error in errors:
-            print(f"  - {error}", file=sys.stderr)
-        sys.exit(1)
+    # Validate workflow (templates are valid by construction)
+    if args.workflow_stdin:
+        is_valid, errors = validate_workflow(workflow_json)
+        if not is_valid:
+            print("Workflow validation errors:", file=sys.stderr)
+            for error in errors:
+                print(f"  - {error}", file=sys.stderr)
+            sys.exit(1)
 
     if args.dry_run:
         print("Generated workflow JSON:")
@@ -506,21 +644,11 @@ def cmd_create(args):
         cli_args.extend(["--status", args.status])
 
     # Pipe workflow JSON to CLI
-    try:
-        result = subprocess.run(
-            ["npx", "trigify-cli"] + cli_args,
-            input=json.dumps(workflow_json),
-            capture_output=True,
-            text=True,
-            cwd="/Users/morganparry/repos/trigify-app"
-        )
-        if result.returncode != 0:
-            print(f"Error creating workflow: {result.stderr or result.stdout}", file=sys.stderr)
-            sys.exit(1)
-        print(result.stdout)
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+    success, output = run_trigify_cli(cli_args, _dumps(workflow_json))
+    if not success:
+        print(f"Error creating workflow: {output}", file=sys.stderr)
         sys.exit(1)
+    print(output)
 
 
 def cmd_list(args):
@@ -565,34 +693,25 @@ def cmd_update(args):
         cli_args.extend(["--enabled", args.enabled])
     if args.status:
         cli_args.extend(["--status", args.status])
+    payload = None
     if args.workflow_stdin:
         cli_args.append("--workflow-stdin")
         try:
-            workflow_json = json.load(sys.stdin)
-            is_valid, errors = validate_workflow(workflow_json)
-            if not is_valid:
-                print("Workflow validation errors:", file=sys.stderr)
-                for error in errors:
-                    print(f"  - {error}", file=sys.stderr)
-                sys.exit(1)
-
-            result = subprocess.run(
-                ["npx", "trigify-cli"] + cli_args,
-                input=json.dumps(workflow_json),
-                capture_output=True,
-                text=True,
-                cwd="/Users/morganparry/repos/trigify-app"
-            )
-            if result.returncode != 0:
-                print(f"Error: {result.stderr or result.stdout}", file=sys.stderr)
-                sys.exit(1)
-            print(result.stdout)
-            return
+            workflow_json = read_workflow_stdin()
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON from stdin: {e}", file=sys.stderr)
             sys.exit(1)
 
-    success, output = run_trigify_cli(cli_args)
+        is_valid, errors = validate_workflow(workflow_json)
+        if not is_valid:
+            print("Workflow validation errors:", file=sys.stderr)
+            for error in errors:
+                print(f"  - {error}", file=sys.stderr)
+            sys.exit(1)
+
+        payload = _dumps(workflow_json)
+
+    success, output = run_trigify_cli(cli_args, payload)
     if not success:
         print(f"Error: {output}", file=sys.stderr)
         sys.exit(1)
@@ -616,7 +735,7 @@ def cmd_delete(args):
 def cmd_validate(args):
     """Validate a workflow JSON."""
     try:
-        workflow_json = json.load(sys.stdin)
+        workflow_json = read_workflow_stdin()
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON: {e}", file=sys.stderr)
         sys.exit(1)
@@ -631,7 +750,99 @@ def cmd_validate(args):
         sys.exit(1)
 
 
-def main():
+# =============================================================================
+# ARGUMENT PARSING
+# =============================================================================
+
+def configure_templates_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the templates command."""
+    parser.set_defaults(func=cmd_templates)
+
+
+def add_template_arguments(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Attach only the arguments of the template named by --template in argv."""
+    # nargs="?" leaves a missing value for the create parser to report with its own usage
+    pre_parser = argparse.ArgumentParser(prog=parser.prog, add_help=False)
+    pre_parser.add_argument("--template", nargs="?")
+    known, _ = pre_parser.parse_known_args(argv)
+
+    template_info = TEMPLATES.get(known.template)
+    if template_info:
+        for flag, spec in template_info["options"].items():
+            # "required" is enforced by cmd_create, since --workflow-stdin makes template args unnecessary
+            options = {key: value for key, value in spec.items() if key != "required"}
+            parser.add_argument(flag, **options)
+
+
+def configure_create_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the create command."""
+    parser.epilog = (
+        "Template-specific arguments are listed by 'workflow.py templates' "
+        "and shown here when --template is given."
+    )
+    parser.add_argument("--name", required=True, help="Workflow name")
+    parser.add_argument("--search-id", help="Link to saved search ID")
+    parser.add_argument("--template", choices=list(TEMPLATES), help="Template name")
+    parser.add_argument("--workflow-stdin", action="store_true", help="Read workflow JSON from stdin")
+    parser.add_argument("--enabled", choices=["true", "false"], default="false", help="Enable workflow")
+    parser.add_argument("--status", choices=["DRAFT", "PUBLISHED"], default="DRAFT", help="Workflow status")
+    parser.add_argument("--dry-run", action="store_true", help="Print generated JSON without creating")
+    add_template_arguments(parser, argv)
+    parser.set_defaults(func=cmd_create)
+
+
+def configure_list_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the list command."""
+    parser.add_argument("--limit", type=int, help="Maximum results")
+    parser.add_argument("--status", choices=["DRAFT", "PUBLISHED"], help="Filter by status")
+    parser.set_defaults(func=cmd_list)
+
+
+def configure_get_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the get command."""
+    parser.add_argument("--id", required=True, help="Workflow ID")
+    parser.set_defaults(func=cmd_get)
+
+
+def configure_update_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the update command."""
+    parser.add_argument("--id", required=True, help="Workflow ID")
+    parser.add_argument("--name", help="New name")
+    parser.add_argument("--enabled", choices=["true", "false"], help="Enable/disable")
+    parser.add_argument("--status", choices=["DRAFT", "PUBLISHED"], help="New status")
+    parser.add_argument("--workflow-stdin", action="store_true", help="Read new workflow JSON from stdin")
+    parser.set_defaults(func=cmd_update)
+
+
+def configure_delete_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the delete command."""
+    parser.add_argument("--id", required=True, help="Workflow ID")
+    parser.set_defaults(func=cmd_delete)
+
+
+def configure_validate_parser(parser: argparse.ArgumentParser, argv: list[str]) -> None:
+    """Add arguments for the validate command."""
+    parser.set_defaults(func=cmd_validate)
+
+
+# Command name -> (help, function that adds the command's arguments)
+COMMANDS = {
+    "templates": ("List available templates", configure_templates_parser),
+    "create": ("Create a workflow", configure_create_parser),
+    "list": ("List workflows", configure_list_parser),
+    "get": ("Get a workflow", configure_get_parser),
+    "update": ("Update a workflow", configure_update_parser),
+    "delete": ("Delete a workflow", configure_delete_parser),
+    "validate": ("Validate workflow JSON from stdin", configure_validate_parser),
+}
+
+
+def build_parser(argv: list[str]) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.
+    Only the command named in argv gets its arguments configured; the others
+    are registered by name so top-level help still lists them.
+    """
     parser = argparse.ArgumentParser(
         description="Workflow management for Trigify",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -654,60 +865,25 @@ Examples:
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    # templates command
-    templates_parser = subparsers.add_parser("templates", help="List available templates")
-    templates_parser.set_defaults(func=cmd_templates)
-
-    # create command
-    create_parser = subparsers.add_parser("create", help="Create a workflow")
-    create_parser.add_argument("--name", required=True, help="Workflow name")
-    create_parser.add_argument("--search-id", help="Link to saved search ID")
-    create_parser.add_argument("--template", help="Template name")
-    create_parser.add_argument("--workflow-stdin", action="store_true", help="Read workflow JSON from stdin")
-    create_parser.add_argument("--enabled", choices=["true", "false"], default="false", help="Enable workflow")
-    create_parser.add_argument("--status", choices=["DRAFT", "PUBLISHED"], default="DRAFT", help="Workflow status")
-    create_parser.add_argument("--dry-run", action="store_true", help="Print generated JSON without creating")
-    # Template-specific args
-    create_parser.add_argument("--channel", help="Slack channel (for slack-notification)")
-    create_parser.add_argument("--message", help="Message template (for slack-notification)")
-    create_parser.add_argument("--url", help="Webhook URL (for webhook-forward)")
-    create_parser.add_argument("--method", default="POST", help="HTTP method (for webhook-forward)")
-    create_parser.add_argument("--positive-channel", help="Positive sentiment channel (for sentiment-filter)")
-    create_parser.add_argument("--negative-channel", help="Negative sentiment channel (for sentiment-filter)")
-    create_parser.add_argument("--crm", choices=["hubspot", "salesforce", "attio"], help="CRM type (for lead-enrich)")
-    create_parser.add_argument("--slack-channel", help="Slack channel (for competitor-engagement)")
-    create_parser.set_defaults(func=cmd_create)
-
-    # list command
-    list_parser = subparsers.add_parser("list", help="List workflows")
-    list_parser.add_argument("--limit", type=int, help="Maximum results")
-    list_parser.add_argument("--status", choices=["DRAFT", "PUBLISHED"], help="Filter by status")
-    list_parser.set_defaults(func=cmd_list)
-
-    # get command
-    get_parser = subparsers.add_parser("get", help="Get a workflow")
-    get_parser.add_argument("--id", required=True, help="Workflow ID")
-    get_parser.set_defaults(func=cmd_get)
-
-    # update command
-    update_parser = subparsers.add_parser("update", help="Update a workflow")
-    update_parser.add_argument("--id", required=True, help="Workflow ID")
-    update_parser.add_argument("--name", help="New name")
-    update_parser.add_argument("--enabled", choices=["true", "false"], help="Enable/disable")
-    update_parser.add_argument("--status", choices=["DRAFT", "PUBLISHED"], help="New status")
-    update_parser.add_argument("--workflow-stdin", action="store_true", help="Read new workflow JSON from stdin")
-    update_parser.set_defaults(func=cmd_update)
-
-    # delete command
-    delete_parser = subparsers.add_parser("delete", help="Delete a workflow")
-    delete_parser.add_argument("--id", required=True, help="Workflow ID")
-    delete_parser.set_defaults(func=cmd_delete)
-
-    # validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate workflow JSON from stdin")
-    validate_parser.set_defaults(func=cmd_validate)
-
-    args = parser.parse_args()
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    for name, (help_text, configure) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if command is None or command == name:
+            configure(command_parser, argv[1:])
+
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+
+    # Fast path for the argument-free listing command
+    if argv == ["templates"]:
+        cmd_templates(None)
+        return
+
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()